@@ -7,12 +7,13 @@
 
 __version__ = "0.6.1"
 
+from bisect import bisect_right
 from datetime import time
-from typing import Any, Dict, List, Optional, Set, Union
+from time import monotonic
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
+import asyncio
 import hassapi as hass
-import math
-import time as t
 
 APP_NAME = "AutoMoLi"
 APP_ICON = "💡"
@@ -33,6 +34,11 @@ DEFAULT_DAYTIMES = [
     dict(starttime="22:30", name="night", light=0),
 ]
 DEFAULT_FADE_DURATION = 3
+# seconds between two brightness steps of the fallback ramp
+FADE_STEP_INTERVAL = 0.2
+
+# home assistant light feature flag for native transitions
+SUPPORT_TRANSITION = 32
 
 EVENT_MOTION_XIAOMI = "xiaomi_aqara.motion"
 
@@ -41,6 +47,37 @@ KEYWORD_MOTION = "binary_sensor.motion_sensor_"
 KEYWORD_HUMIDITY = "sensor.humidity_"
 KEYWORD_ILLUMINANCE = "sensor.illumination_"
 
+# umlaut folding for friendly name matching
+UMLAUTS = str.maketrans(
+    {"ü": "u", "ä": "a", "ö": "o", "Ü": "u", "Ä": "a", "Ö": "o"}
+)
+
+
+class Rule(NamedTuple):
+    """Parsed `disable_switch_entity` line."""
+
+    conf: str
+    entity: str
+    disable_state: str
+    attrs: Tuple[Tuple[str, str], ...]
+
+
+def _parse_disable_rule(conf_line: str) -> Rule:
+    """Parse 'entity, state; attribute, value; ...' into a `Rule`."""
+    conf = conf_line.split(";")  # split each conf elements
+    attrs: List[Tuple[str, str]] = []
+    try:
+        entity, disable_state = map(str.strip, conf[0].split(",", 1))
+        for att_conf in conf[1:]:
+            att, att_state = map(str.strip, att_conf.split(",", 1))
+            attrs.append((att, att_state))
+    except ValueError:
+        raise ValueError(
+            f"invalid disable_switch_entity '{conf_line}', "
+            f"expected 'entity, state; attribute, value; ...'"
+        )
+    return Rule(conf_line, entity, disable_state, tuple(attrs))
+
 
 # install requirements
 def _install_packages(required: Set[str]) -> bool:
@@ -51,7 +88,16 @@ def _install_packages(required: Set[str]) -> bool:
     return run([executable, "-m", "pip", "install", *flags, *required]).returncode == 0
 
 
-_install_packages(APP_REQUIREMENTS)
+def _ensure_deps() -> None:
+    """Install requirements only if they are not importable already."""
+    try:
+        from adutils import ADutils, hl, py37_or_higher  # noqa
+    except ImportError:
+        _install_packages(APP_REQUIREMENTS)
+
+
+# only run pip if needed, app reloads happen often
+_ensure_deps()
 
 from adutils import ADutils, hl, py37_or_higher  # noqa # isort:skip
 
@@ -91,7 +137,9 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         # on/off switch via input.boolean
         self.disable_switch_entity = self.args.get("disable_switch_entity", [])
-        # print (*self.disable_switch_entity)
+        self._disable_rules = [
+            _parse_disable_rule(line) for line in self.disable_switch_entity
+        ]
 
         # fade on/off delay 
         self.fadeSetting = {
@@ -105,37 +153,83 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # lights_off callback handle
         self._handle = None
 
+        # running fallback ramp as (direction, task), only touched on the event loop
+        self._fading: Optional[Tuple[str, asyncio.Task]] = None
+
+        # end of the running fade-out, lights still report "on" until then
+        self._fade_out_until = 0.0
+
+        # motion sensors currently not reporting "motion_off"
+        self._active_motion: Set[str] = set()
+
+        all_states = self.get_state()
+
         # define light entities switched by automoli
-        self.lights: Set[str] = self.args.get("lights", set())
-        if not self.lights:
-            room_light_group = f"light.{self.room}"
+        lights: Set[str] = self.args.get("lights", set())
+        room_light_group = f"light.{self.room}"
+
+        # lowercased friendly names, only needed if entities have to be discovered
+        name_map: Dict[str, str] = {}
+        if (
+            (not lights and not self.entity_exists(room_light_group))
+            or not self.sensors["motion"]
+            or (self.thresholds["humidity"] and not self.sensors["humidity"])
+            or (self.thresholds["illuminance"] and not self.sensors["illuminance"])
+        ):
+            name_map = {
+                entity: str(
+                    self.cached_state(all_states, entity, "friendly_name") or entity
+                )
+                .lower()
+                .translate(UMLAUTS)
+                for entity in all_states
+            }
+
+        if not lights:
             if self.entity_exists(room_light_group):
-                self.lights.add(room_light_group)
+                lights.add(room_light_group)
             else:
-                self.lights.update(self.find_sensors(KEYWORD_LIGHTS))
-            if not self.lights:
+                lights.update(
+                    self.find_sensors(KEYWORD_LIGHTS, name_map)
+                )
+            if not lights:
                 raise ValueError(f"No lights available, sorry! ('{KEYWORD_LIGHTS}')")
 
         # define sensor entities monitored by automoli
         if not self.sensors["motion"]:
-            self.sensors["motion"].update(self.find_sensors(KEYWORD_MOTION))
+            self.sensors["motion"].update(
+                self.find_sensors(KEYWORD_MOTION, name_map)
+            )
             if not self.sensors["motion"]:
                 raise ValueError(f"No sensors given/found, sorry! ('{KEYWORD_MOTION}')")
 
         # enumerate humidity sensors if threshold given
         if self.thresholds["humidity"] and not self.sensors["humidity"]:
-            self.sensors["humidity"].update(self.find_sensors(KEYWORD_HUMIDITY))
+            self.sensors["humidity"].update(
+                self.find_sensors(KEYWORD_HUMIDITY, name_map)
+            )
             if not self.sensors["humidity"]:
                 self.log(f"No humidity sensors available → disabling blocker.")
                 self.thresholds["humidity"] = None
 
         # enumerate illuminance sensors if threshold given
         if self.thresholds["illuminance"] and not self.sensors["illuminance"]:
-            self.sensors["illuminance"].update(self.find_sensors(KEYWORD_ILLUMINANCE))
+            self.sensors["illuminance"].update(
+                self.find_sensors(KEYWORD_ILLUMINANCE, name_map)
+            )
             if not self.sensors["illuminance"]:
                 self.log(f"No illuminance sensors available → disabling blocker.")
                 self.thresholds["illuminance"] = None
 
+        # entities are not changed after discovery, freeze them
+        self.lights: Tuple[str, ...] = tuple(lights)
+        self.sensors = {key: tuple(value) for key, value in self.sensors.items()}
+
+        # entities read on every event, threshold sensors are read on demand
+        self._event_entities = tuple(
+            {*self.lights, *(rule.entity for rule in self._disable_rules)}
+        )
+
         # use user-defined daytimes if available
         daytimes = self.build_daytimes(self.args.get("daytimes", DEFAULT_DAYTIMES))
 
@@ -161,14 +255,26 @@ class AutoMoLi(hass.Hass):  # type: ignore
                     self.motion_cleared, entity=sensor, new=self.states["motion_off"]
                 )
 
+                # seed active sensors, kept up to date by the callbacks above
+                if self.cached_state(all_states, sensor) != self.states["motion_off"]:
+                    self._active_motion.add(sensor)
+
+        # entity lists passed to grouped service calls
+        self._switches = tuple(e for e in self.lights if e.startswith("switch."))
+        dimmables = [e for e in self.lights if not e.startswith("switch.")]
+        self._transition_lights = tuple(
+            e for e in dimmables if self.supports_transition(e, all_states)
+        )
+        self._ramp_lights = tuple(
+            e for e in dimmables if e not in self._transition_lights
+        )
+
         # display settings
         self.args.setdefault("listeners", self.sensors["motion"])
-        self.args.setdefault(
-            "sensors_illuminance", list(self.sensors["illuminance"])
-        ) if self.sensors["illuminance"] else None
-        self.args.setdefault(
-            "sensors_humidity", list(self.sensors["humidity"])
-        ) if self.sensors["humidity"] else None
+        if self.sensors["illuminance"]:
+            self.args.setdefault("sensors_illuminance", self.sensors["illuminance"])
+        if self.sensors["humidity"]:
+            self.args.setdefault("sensors_humidity", self.sensors["humidity"])
         self.args["daytimes"] = daytimes
 
         # init adutils
@@ -203,67 +309,115 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 )
 
     ########################## twu: additional features #############################################
-    def eval_disable_switch_conf(self, confLine):
-        # map(str.strip, my_list)
-        conf = confLine.split(';')  # split each conf elements 
-        entity, disableStat = map(str.strip, conf[0].split(',')) # get entity and disableState
-        
-        rtn = False # True: to disable
-
-        # 1. check the status
-        # if status is not true: no need to check att 
-        # print ('State to satisfy: {} => {}, curr: {}'.format(entity, disableStat, self.get_state(entity)))
-        # for attConf in conf[1:]:
-        #     att, attStat = map(str.strip, attConf.split(','))
-        #     # debug message 
-        #     print ('Attribute to disable auto: {}: {} => {}, curr: {}'.format(entity, att, attStat, self.get_state(entity, att)))
-
-        # print (' ==> {} att len = {}'.format(self.get_state(entity), len(conf[1:])) ) 
-        if self.get_state(entity) == disableStat:
-            # else go through the attributes if any 
-            statCond = True
-            attCond = False 
-            if (len(conf[1:]) == 0):
-                attCond = True
-            
-            for attConf in conf[1:]:
-                att, attStat = map(str.strip, attConf.split(','))
-                currAtt = self.get_state(entity, att)
-                if (currAtt == attStat or (currAtt is None and "None" == attStat)):
-                    print('attributes satisfied to disable automation')
-                    attCond = True
-                    break
-            if (attCond and statCond):
-                rtn = True
-        else:
-            rtn = False
-        # print ('return val of eval_disable_switch_conf {} => {} '.format(confLine, rtn))
-        return rtn        
+    @staticmethod
+    def cached_state(
+        states: Dict[str, Any], entity: str, attribute: Optional[str] = None
+    ) -> Any:
+        """Read a state/attribute from a per-event state snapshot."""
+        entry = states.get(entity) or {}
+        if attribute is None:
+            return entry.get("state")
+        return entry.get("attributes", {}).get(attribute)
+
+    def snapshot_states(self, entities: Tuple[str, ...]) -> Dict[str, Any]:
+        """Read state and attributes of the given entities for one event."""
+        return {
+            entity: self.get_state(entity, attribute="all") for entity in entities
+        }
+
+    def eval_disable_switch_conf(self, rule: Rule, states: Dict[str, Any]) -> bool:
+        """Check if a disable rule is satisfied (True: to disable)."""
+        # if status is not true: no need to check att
+        if self.cached_state(states, rule.entity) != rule.disable_state:
+            return False
+
+        # no attributes given → state alone disables
+        if not rule.attrs:
+            return True
+
+        # else go through the attributes
+        for att, att_state in rule.attrs:
+            curr_att = self.cached_state(states, rule.entity, att)
+            if curr_att == att_state or (curr_att is None and att_state == "None"):
+                return True
+
+        return False
+
+    def supports_transition(self, entity: str, states: Dict[str, Any]) -> bool:
+        """Check if a light fades natively via the `transition` parameter."""
+        # the feature bit means something else in other domains (fan, cover, ...)
+        if not entity.startswith("light."):
+            return False
+        features = self.cached_state(states, entity, "supported_features")
+        try:
+            return bool(int(features or 0) & SUPPORT_TRANSITION)
+        except (TypeError, ValueError):
+            return False
+
+    def start_fade(
+        self, direction: str, targetBrightnessPct: int, duration: int
+    ) -> None:
+        """Ramp the fallback lights, unless the same ramp is already running."""
+        # called from worker threads, so hand the task bookkeeping to the event loop
+        self.create_task(self.restart_fade(direction, targetBrightnessPct, duration))
 
-    async def fade(self, entity, direction, targetBrightnessPct, duration):
+    async def restart_fade(
+        self, direction: str, targetBrightnessPct: int, duration: int
+    ) -> None:
+        """Replace the running ramp, runs on the event loop."""
+        if self._fading is not None:
+            running_direction, task = self._fading
+            if not task.done():
+                if running_direction == direction:
+                    return
+                # reverse direction, the new ramp starts from the current brightness
+                task.cancel()
+
+        # via appdaemon, so reloads cancel the ramp and errors get reported
+        task = self.create_task(
+            self.fade(self._ramp_lights, direction, targetBrightnessPct, duration)
+        )
+        self._fading = (direction, task)
+
+    async def fade(self, entities, direction, targetBrightnessPct, duration):
+        # fallback ramp for lights without native transition support
         # bound = self.active["light_setting"] if direction == "up" else 0  #target brightness in setting 
-        targetBrightness = targetBrightnessPct * 255 / 100
-        adjFrequency = 0.2
-        adjPoints = duration / adjFrequency
-        initBrightness = await self.get_state(entity, "brightness")
-        initBrightness = initBrightness if initBrightness is not None else 0
-        step = int(math.ceil ((float(targetBrightness) - float(initBrightness) if direction == "up" else -1.0 * float(initBrightness)) / float(adjPoints) ) ) # using int division
-        
-        # print (initBrightness, targetBrightness, step, direction, duration)
-        # print (type(initBrightness), type(targetBrightness), type(step))
-        
-        if (step != 0):
-            for b in range(int(initBrightness), int(targetBrightness), int(step)):
+        targetBrightness = int(targetBrightnessPct) * 255 // 100
+        adjPoints = max(1, round(duration / FADE_STEP_INTERVAL))
+
+        # group entities by current brightness, each group ramps from its own level
+        groups: Dict[int, List[str]] = {}
+        for entity in entities:
+            brightness = await self.get_state(entity, "brightness")
+            groups.setdefault(int(brightness or 0), []).append(entity)
+
+        await asyncio.gather(
+            *(
+                self.ramp(group, direction, initBrightness, targetBrightness, adjPoints)
+                for initBrightness, group in groups.items()
+            )
+        )
+
+    async def ramp(
+        self, entities, direction, initBrightness, targetBrightness, adjPoints
+    ):
+        # one grouped call per step for entities sharing the same start level
+        diff = targetBrightness - initBrightness if direction == "up" else -initBrightness
+        step = -(-diff // adjPoints)  # ceil division on ints
+
+        # the final call below sets the target itself
+        if step != 0:
+            for b in range(initBrightness, targetBrightness, step):
                 await self.call_service(
                     "homeassistant/turn_on",
-                    entity_id = entity,
+                    entity_id = entities,
                     brightness = b,
                 )
-                t.sleep(adjFrequency)
+                await asyncio.sleep(FADE_STEP_INTERVAL)
         await self.call_service(
                 "homeassistant/turn_on",
-                entity_id = entity,
-                brightness = int(targetBrightness),
+                entity_id = entities,
+                brightness = targetBrightness,
             )
         # self.adu.log(
         #     f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
@@ -275,28 +429,24 @@ class AutoMoLi(hass.Hass):  # type: ignore
     def motion_cleared(
         self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]
     ) -> None:
+        self._active_motion.discard(entity)
+
         # starte the timer if motion is cleared
-        if all(
-            [
-                self.get_state(sensor) == self.states["motion_off"]
-                for sensor in self.sensors["motion"]
-            ]
-        ):
+        if not self._active_motion:
             # all motion sensors off, starting timer
             self.refresh_timer()
         else:
-            if self._handle:
-                # cancelling active timer
-                self.cancel_timer(self._handle)
+            # cancelling active timer
+            self.cancel_off_timer()
 
     def motion_detected(
         self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]
     ) -> None:
         # wrapper function
+        self._active_motion.add(entity)
 
-        if self._handle:
-            # cancelling active timer
-            self.cancel_timer(self._handle)
+        # cancelling active timer, detection events do not refresh it
+        self.cancel_off_timer()
 
         # calling motion event handler
         data: Dict[str, Any] = {"entity_id": entity, "new": new, "old": old}
@@ -312,19 +462,27 @@ class AutoMoLi(hass.Hass):  # type: ignore
             level="DEBUG",
         )
 
+        # snapshot lights and disable switches once for this event
+        states = self.snapshot_states(self._event_entities)
+
         # check if automoli is disabled via home assistant entity
-        for lineStr in self.disable_switch_entity:
-            if self.eval_disable_switch_conf(lineStr):
-                self.adu.log(f"AutoMoLi disabled via {lineStr}",)
+        for rule in self._disable_rules:
+            if self.eval_disable_switch_conf(rule, states):
+                self.adu.log(f"AutoMoLi disabled via {rule.conf}",)
                 return
 
         # if self.get_state(self.disable_switch_entity) == "off":
         #     self.adu.log(f"AutoMoLi disabled via {self.disable_switch_entity}",)
         #     return
 
+        # lights fading out still report "on", bring them back up as if off
+        fading_out = monotonic() < self._fade_out_until
+
         # turn on the lights if not already
-        if not any([self.get_state(light) == "on" for light in self.lights]):
-            self.lights_on()
+        if fading_out or not any(
+            self.cached_state(states, light) == "on" for light in self.lights
+        ):
+            self.lights_on(states)
         else:
             self.adu.log(
                 f"light in {self.room.capitalize()} already on → refreshing the timer",
@@ -334,23 +492,34 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if event != "state_changed_detection":
             self.refresh_timer()
 
+    def cancel_off_timer(self) -> None:
+        """Cancel the pending lights_off callback, if any."""
+        if self._handle is not None:
+            self.cancel_timer(self._handle)
+            self._handle = None
+
     def refresh_timer(self) -> None:
         """Refresh delay timer."""
-        self.cancel_timer(self._handle)
+        self.cancel_off_timer()
         if self.active["delay"] != 0:
             self._handle = self.run_in(self.lights_off, self.active["delay"])
 
-    def lights_on(self) -> None:
+    def lights_on(self, states: Optional[Dict[str, Any]] = None) -> None:
         """Turn on the lights."""
+        if states is None:
+            states = self.snapshot_states(self._event_entities)
+
         if self.thresholds["illuminance"]:
             blocker = []
+            illuminances = self.snapshot_states(self.sensors["illuminance"])
             for sensor in self.sensors["illuminance"]:
+                illuminance = self.cached_state(illuminances, sensor)
                 try:
-                    if float(self.get_state(sensor)) >= self.thresholds["illuminance"]:
+                    if float(illuminance) >= self.thresholds["illuminance"]:
                         blocker.append(sensor)
-                except ValueError as error:
+                except (TypeError, ValueError) as error:
                     self.adu.log(
-                        f"could not parse illuminance '{self.get_state(sensor)}' from "
+                        f"could not parse illuminance '{illuminance}' from "
                         f"'{sensor}': {error}"
                     )
                     return
@@ -361,129 +530,171 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 )
                 return
 
-        if isinstance(self.active["light_setting"], str):
+        # turning on replaces a running fade-out
+        self._fade_out_until = 0.0
+
+        light_setting = self.active["light_setting"]
+
+        if isinstance(light_setting, str):
+
+            # same for every entity, look up once
+            is_hue = self.active["is_hue_group"]
+            scene = light_setting if light_setting.startswith("scene.") else None
+
+            # collect entities/scenes to switch on with one grouped call
+            items: List[str] = []
 
             for entity in self.lights:
 
-                if self.active["is_hue_group"] and self.get_state(
-                    entity_id=entity, attribute="is_hue_group"
-                ):
+                if is_hue and self.cached_state(states, entity, "is_hue_group"):
                     self.call_service(
                         "hue/hue_activate_scene",
-                        group_name=self.friendly_name(entity),
-                        scene_name=self.active["light_setting"],
+                        group_name=self.cached_state(states, entity, "friendly_name")
+                        or entity,
+                        scene_name=light_setting,
                     )
                     continue
 
-                item = entity
+                item = scene or entity
 
-                if self.active["light_setting"].startswith("scene."):
-                    item = self.active["light_setting"]
+                if item not in items:
+                    items.append(item)
 
+            if items:
                 # self.turn_on(item)
-                self.call_service("homeassistant/turn_on", entity_id=item)
+                self.call_service("homeassistant/turn_on", entity_id=items)
 
             self.adu.log(
                 f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
-                f"{'hue' if self.active['is_hue_group'] else 'ha'} scene: "
-                f"{hl(self.active['light_setting'].replace('scene.', ''))}",
+                f"{'hue' if is_hue else 'ha'} scene: "
+                f"{hl(light_setting.replace('scene.', ''))}",
                 icon=ON_ICON,
             )
 
-        elif isinstance(self.active["light_setting"], int):
+        elif isinstance(light_setting, int):
 
-            if self.active["light_setting"] == 0:
-                self.lights_off(dict())
+            if light_setting == 0:
+                self.lights_off(dict(), states)
 
             else:
-                for entity in self.lights:
-                    if entity.startswith("switch."):
-                        self.call_service("homeassistant/turn_on", entity_id=entity)
-                    else:
-                        ####################################### call fade on
-                        # self.call_service(
-                        #     "homeassistant/turn_on",
-                        #     entity_id=entity,
-                        #     brightness_pct=self.active["light_setting"],
-                        # )
-                        # entity, direction, targetBrightnessPct, duration
-                        targetBrightnessPct = self.active['light_setting']
-                        fadeDuration = self.fadeSetting["on"]
-                        
-                        self.create_task(self.fade(entity, "up", targetBrightnessPct, fadeDuration))
-
-                        self.adu.log(
-                            f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
-                            f"brightness: {hl(self.active['light_setting'])}%",
-                            icon=ON_ICON,
-                        )
+                if self._switches:
+                    self.call_service("homeassistant/turn_on", entity_id=self._switches)
+
+                # let home assistant/the device do the fading
+                if self._transition_lights:
+                    self.call_service(
+                        "light/turn_on",
+                        entity_id=self._transition_lights,
+                        brightness_pct=light_setting,
+                        transition=self.fadeSetting["on"],
+                    )
+
+                if self._ramp_lights:
+                    # direction, targetBrightnessPct, duration
+                    self.start_fade("up", light_setting, self.fadeSetting["on"])
+
+                self.adu.log(
+                    f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
+                    f"brightness: {hl(light_setting)}%",
+                    icon=ON_ICON,
+                )
 
         else:
             raise ValueError(
-                f"invalid brightness/scene: {self.active['light_setting']!s} "
-                f"in {self.room}"
+                f"invalid brightness/scene: {light_setting!s} in {self.room}"
             )
 
-    def lights_off(self, kwargs: Dict[str, Any]) -> None:
+    def lights_off(
+        self, kwargs: Dict[str, Any], states: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Turn off the lights."""
+        if states is None:
+            states = self.snapshot_states(self._event_entities)
 
         # check if automoli is disabled via home assistant entity
-        for lineStr in self.disable_switch_entity:
-            if self.eval_disable_switch_conf(lineStr):
-                self.adu.log(f"AutoMoLi disabled via {lineStr}",)
+        for rule in self._disable_rules:
+            if self.eval_disable_switch_conf(rule, states):
+                self.adu.log(f"AutoMoLi disabled via {rule.conf}",)
                 return
 
         # if self.get_state(self.disable_switch_entity) == "off":
         #     self.adu.log(f"AutoMoLi disabled via {self.disable_switch_entity}",)
         #     return
 
-        blocker: Any = None
+        # humidity sensor over the threshold with its parsed value
+        blocker: Optional[Tuple[str, float]] = None
 
         if self.thresholds["humidity"]:
-            blocker = [
-                sensor
-                for sensor in self.sensors["humidity"]
-                if float(self.get_state(sensor)) >= self.thresholds["humidity"]
-            ]
-            blocker = blocker.pop() if blocker else None
+            humidities = self.snapshot_states(self.sensors["humidity"])
+            for sensor in self.sensors["humidity"]:
+                humidity = self.cached_state(humidities, sensor)
+                try:
+                    value = float(humidity)
+                except (TypeError, ValueError) as error:
+                    self.adu.log(
+                        f"could not parse humidity '{humidity}' from "
+                        f"'{sensor}': {error}"
+                    )
+                    # unlike the illuminance check in lights_on, do not abort here:
+                    # a broken humidity sensor must not keep the lights on forever
+                    continue
+                if value >= self.thresholds["humidity"]:
+                    blocker = (sensor, value)
 
         # turn off if not blocked
         if blocker:
+            _, humidity = blocker
             self.refresh_timer()
             self.adu.log(
                 f"🛁 no motion in {hl(self.room.capitalize())} since "
                 f"{hl(self.active['delay'])}s → "
-                f"but {hl(float(self.get_state(blocker)))}%RH > "
+                f"but {hl(humidity)}%RH > "
                 f"{self.thresholds['humidity']}%RH"
             )
         else:
-            self.cancel_timer(self._handle)
-            if any([(self.get_state(entity)) == "on" for entity in self.lights]):
-                for entity in self.lights:
-                    # self.turn_off(entity)
-                    ################## call fade 
-                    self.create_task(self.fade(entity, "down", 0, self.fadeSetting["off"]))
+            self.cancel_off_timer()
+            if any(self.cached_state(states, entity) == "on" for entity in self.lights):
+                if self._switches:
+                    self.call_service("homeassistant/turn_off", entity_id=self._switches)
+
+                if self._transition_lights:
+                    self.call_service(
+                        "light/turn_off",
+                        entity_id=self._transition_lights,
+                        transition=self.fadeSetting["off"],
+                    )
+
+                if self._ramp_lights:
+                    self.start_fade("down", 0, self.fadeSetting["off"])
+
+                self._fade_out_until = monotonic() + self.fadeSetting["off"]
                 self.adu.log(
                     f"no motion in {hl(self.room.capitalize())} since "
                     f"{hl(self.active['delay'])}s → turned {hl(f'off')}",
                     icon=OFF_ICON,
                 )
 
-    def find_sensors(self, keyword: str) -> List[str]:
+    def find_sensors(self, keyword: str, name_map: Dict[str, str]) -> List[str]:
         """Find sensors by looking for a keyword in the friendly_name."""
         return [
             sensor
-            for sensor in self.get_state()
-            if keyword in sensor
-            and self.room in (self.friendly_name(sensor)).lower().replace("ü", "u")
+            for sensor, name in name_map.items()
+            if keyword in sensor and self.room in name
         ]
 
     def build_daytimes(
         self, daytimes: List[Any]
     ) -> Optional[List[Dict[str, Union[int, str]]]]:
         starttimes: Set[time] = set()
+        built: List[Tuple[time, Dict[str, Union[int, str]]]] = []
         delay = int(self.args.get("delay", DEFAULT_DELAY))
 
+        # same for all daytimes, so ask only once
+        any_hue_group = any(
+            self.get_state(entity_id=entity, attribute="is_hue_group")
+            for entity in self.lights
+        )
+
         for idx, daytime in enumerate(daytimes):
             dt_name = daytime.get("name", f"{DEFAULT_NAME}_{idx}")
             dt_delay = daytime.get("delay", delay)
@@ -491,19 +702,17 @@ class AutoMoLi(hass.Hass):  # type: ignore
             dt_is_hue_group = (
                 isinstance(dt_light_setting, str)
                 and not dt_light_setting.startswith("scene.")
-                and any(
-                    [
-                        self.get_state(entity_id=entity, attribute="is_hue_group")
-                        for entity in self.lights
-                    ]
-                )
+                and any_hue_group
             )
 
             dt_start: time
             try:
                 # dt_start = time.fromisoformat(str(daytime.get("starttime")))
                 dt_start = self.parse_time(daytime.get("starttime"), aware=True)
-                print (f'{daytime.get("starttime")} => start time = {dt_start}')
+                self.adu.log(
+                    f"{daytime.get('starttime')} → start time: {dt_start}",
+                    level="DEBUG",
+                )
             except ValueError as error:
                 raise ValueError(f"missing start time in daytime '{dt_name}': {error}")
 
@@ -516,11 +725,6 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 is_hue_group=dt_is_hue_group,
             )
 
-            # info about next daytime
-            # next_dt_start = time.fromisoformat(
-            #     str(daytimes[(idx + 1) % len(daytimes)].get("starttime"))
-            # )
-            next_dt_start = daytimes[(idx + 1) % len(daytimes)].get("starttime")
             # collect all start times for sanity check
             if dt_start in starttimes:
                 raise ValueError(
@@ -529,15 +733,19 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 )
 
             starttimes.add(dt_start)
-
-            # check if this daytime should ne active now
-            if self.now_is_between(str(dt_start), str(next_dt_start)):
-                self.switch_daytime(dict(daytime=daytime, initial=True))
-                self.args["active_daytime"] = daytime.get("daytime")
+            built.append((dt_start.replace(tzinfo=None), daytime))
 
             # schedule callbacks for daytime switching
             self.run_daily(
                 self.switch_daytime, dt_start, random_start=-10, **dict(daytime=daytime)
             )
 
+        # activate the daytime started last, before the first one wraps to the last
+        if built:
+            built.sort(key=lambda start_daytime: start_daytime[0])
+            idx = bisect_right([start for start, _ in built], self.time()) - 1
+            active_daytime = built[idx][1]
+            self.switch_daytime(dict(daytime=active_daytime, initial=True))
+            self.args["active_daytime"] = active_daytime.get("daytime")
+
         return daytimes